@@ -3,7 +3,7 @@ from __future__ import annotations
 import itertools
 import logging
 import time
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
@@ -36,6 +36,8 @@ from .sweeps import AbstractSweep, TogetherSweep
 LOG = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
     from qcodes.dataset.dond.do_nd_utils import (
         ActionsT,
@@ -56,7 +58,7 @@ class ParameterGroup(TypedDict):
     meas_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterSetEvent:
     parameter: ParameterBase
     new_value: SweepVarType
@@ -74,27 +76,119 @@ class _Sweeper:
     ):
         self._additional_setpoints = additional_setpoints
         self._sweeps = sweeps
-        self._setpoints = self._make_setpoints_tuples()
+        self._dim_setpoints = tuple(
+            self._unboxed_setpoints(sweep) for sweep in self._sweeps
+        )
+        self._dim_strides = self._make_strides(self._dim_setpoints)
         self._setpoints_dict = self._make_setpoints_dict()
         self._shape = self._make_shape(sweeps, additional_setpoints)
+        self._num_points = int(np.prod(self._shape))
         self._iter_index = 0
+        self._change_tables = self._make_change_tables()
+        # resolve the static per-sweep attributes once; param, delay,
+        # post_actions and get_after_set are all properties and would
+        # otherwise be re-resolved for every sweep on every step
+        self._event_templates = tuple(
+            (sweep.param, sweep.delay, sweep.post_actions, sweep.get_after_set)
+            for sweep in self.all_sweeps
+        )
 
     @property
     def setpoints_dict(self) -> dict[str, list[Any]]:
         return self._setpoints_dict
 
-    def _make_setpoints_tuples(
+    @staticmethod
+    def _unboxed_setpoints(
+        sweep: AbstractSweep | TogetherSweep,
+    ) -> tuple[tuple[SweepVarType, ...] | SweepVarType, ...]:
+        # Convert the setpoint arrays to plain Python scalars via tolist()
+        # once at construction; otherwise every value handed to a parameter
+        # set call and every result row carries a boxed numpy scalar.
+        if isinstance(sweep, TogetherSweep):
+            return tuple(
+                zip(
+                    *(
+                        np.asarray(sub_sweep.get_setpoints()).tolist()
+                        for sub_sweep in sweep.sweeps
+                    )
+                )
+            )
+        return tuple(np.asarray(sweep.get_setpoints()).tolist())
+
+    @staticmethod
+    def _make_strides(
+        dim_setpoints: tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...],
+    ) -> tuple[int, ...]:
+        strides: list[int] = []
+        stride = 1
+        for values in reversed(dim_setpoints):
+            strides.append(stride)
+            stride *= len(values)
+        return tuple(reversed(strides))
+
+    def _setpoint_values_at(
+        self, index: int
+    ) -> tuple[tuple[SweepVarType, ...] | SweepVarType, ...]:
+        # Index the cartesian product lazily instead of materializing every
+        # product tuple up front: dimension k of point ``index`` is entry
+        # ``(index // stride_k) % size_k`` of that dimension's setpoints,
+        # in the same ordering as ``itertools.product``.
+        return tuple(
+            values[(index // stride) % len(values)]
+            for values, stride in zip(self._dim_setpoints, self._dim_strides)
+        )
+
+    def _make_change_tables(
         self,
-    ) -> tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...]:
-        sweeps = tuple(sweep.get_setpoints() for sweep in self._sweeps)
-        return cast(
-            tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...],
-            tuple(itertools.product(*sweeps)),
+    ) -> tuple[tuple[int, int, tuple[bool, ...]], ...]:
+        """
+        Per swept parameter (in ``all_sweeps`` order), precompute when its
+        value actually changes between consecutive points of the cartesian
+        product. The parameter's dimension only advances at steps that are a
+        multiple of its stride, and whether advancing from entry ``j - 1`` to
+        entry ``j`` changes the value depends only on the 1D setpoint array,
+        so a per-axis table of neighbour differences replaces per-step value
+        comparisons. Entry 0 of the table covers the wrap-around from the
+        last entry back to the first.
+        """
+        tables: list[tuple[int, int, tuple[bool, ...]]] = []
+
+        def _table(values: tuple[SweepVarType, ...]) -> tuple[bool, ...]:
+            if len(values) == 0:
+                return ()
+            arr = np.asarray(values)
+            if arr.ndim == 1 and arr.dtype != np.object_:
+                changed = np.empty(len(arr), dtype=bool)
+                changed[0] = bool(arr[0] != arr[-1])
+                np.not_equal(arr[1:], arr[:-1], out=changed[1:])
+                return tuple(changed.tolist())
+            # non-scalar (e.g. tuple-valued) setpoints fall back to
+            # element-wise Python comparisons
+            return tuple(bool(values[j] != values[j - 1]) for j in range(len(values)))
+
+        for dim, sweep in enumerate(self._sweeps):
+            dim_values = self._dim_setpoints[dim]
+            stride = self._dim_strides[dim]
+            size = len(dim_values)
+            if isinstance(sweep, TogetherSweep):
+                for sub_index in range(len(sweep.sweeps)):
+                    sub_values = tuple(values[sub_index] for values in dim_values)
+                    tables.append((stride, size, _table(sub_values)))
+            else:
+                tables.append((stride, size, _table(dim_values)))
+        return tuple(tables)
+
+    def _changed_flags_at(self, index: int) -> tuple[bool, ...]:
+        if index == 0:
+            return (True,) * len(self._change_tables)
+        return tuple(
+            False if index % stride else changed[(index // stride) % size]
+            for stride, size, changed in self._change_tables
         )
 
     def _make_single_point_setpoints_dict(self, index: int) -> dict[str, SweepVarType]:
         setpoint_dict = {}
-        values = self._setpoints[index]
+        values = self._setpoint_values_at(index)
         for sweep, subvalues in zip(self._sweeps, values):
             if isinstance(sweep, TogetherSweep):
                 for individual_sweep, value in zip(sweep.sweeps, subvalues):
@@ -104,24 +198,32 @@ class _Sweeper:
         return setpoint_dict
 
     def _make_setpoints_dict(self) -> dict[str, list[Any]]:
+        # Build the flattened per-parameter columns of the cartesian product
+        # directly with repeat/tile rather than iterating every product tuple
+        # in Python. For axis k the flat column repeats each value
+        # prod(sizes[k+1:]) times and tiles the result prod(sizes[:k]) times,
+        # which matches the ordering of ``itertools.product``.
         setpoint_dict: dict[str, list[SweepVarType]] = {}
 
-        for sweep in self._sweeps:
+        sizes = [sweep.num_points for sweep in self._sweeps]
+
+        def _flat_column(values: npt.NDArray, axis: int) -> list[SweepVarType]:
+            inner = int(np.prod(sizes[axis + 1 :]))
+            outer = int(np.prod(sizes[:axis]))
+            # tolist() converts in a single C-level pass and yields plain
+            # Python scalars, where list() would box a numpy scalar per entry
+            return np.tile(np.repeat(values, inner), outer).tolist()
+
+        for axis, sweep in enumerate(self._sweeps):
             if isinstance(sweep, TogetherSweep):
                 for individual_sweep in sweep.sweeps:
-                    setpoint_dict[individual_sweep.param.full_name] = []
+                    setpoint_dict[individual_sweep.param.full_name] = _flat_column(
+                        np.asarray(individual_sweep.get_setpoints()), axis
+                    )
             else:
-                setpoint_dict[sweep.param.full_name] = []
-
-        for setpoint_tuples in self._setpoints:
-            for sweep, values in zip(self._sweeps, setpoint_tuples):
-                if isinstance(sweep, TogetherSweep):
-                    for individual_sweep, individual_value in zip(sweep.sweeps, values):
-                        setpoint_dict[individual_sweep.param.full_name].append(
-                            individual_value
-                        )
-                else:
-                    setpoint_dict[sweep.param.full_name].append(values)
+                setpoint_dict[sweep.param.full_name] = _flat_column(
+                    np.asarray(sweep.get_setpoints()), axis
+                )
         return setpoint_dict
 
     @property
@@ -205,43 +307,35 @@ class _Sweeper:
         return self._shape
 
     def __getitem__(self, index: int) -> tuple[ParameterSetEvent, ...]:
+        # The setpoints dict is built in ``all_sweeps`` order, matching the
+        # precomputed change tables and event templates.
         setpoints = self._make_single_point_setpoints_dict(index)
-
-        if index == 0:
-            previous_setpoints: dict[str, SweepVarType | None] = {}
-            for key in setpoints.keys():
-                previous_setpoints[key] = None
-        else:
-            previous_setpoints = self._make_single_point_setpoints_dict(index - 1)
+        changed_flags = self._changed_flags_at(index)
 
         parameter_set_events = []
 
-        for sweep in self.all_sweeps:
-            new_value = setpoints[sweep.param.full_name]
-            old_value = previous_setpoints[sweep.param.full_name]
-            if old_value is None or old_value != new_value:
-                should_set = True
-            else:
-                should_set = False
+        for (param, delay, actions, get_after_set), new_value, should_set in zip(
+            self._event_templates, setpoints.values(), changed_flags
+        ):
             event = ParameterSetEvent(
                 new_value=new_value,
-                parameter=sweep.param,
+                parameter=param,
                 should_set=should_set,
-                delay=sweep.delay,
-                actions=sweep.post_actions,
-                get_after_set=sweep.get_after_set,
+                delay=delay,
+                actions=actions,
+                get_after_set=get_after_set,
             )
             parameter_set_events.append(event)
         return tuple(parameter_set_events)
 
     def __len__(self) -> int:
-        return int(np.prod(self.shape))
+        return self._num_points
 
     def __iter__(self) -> _Sweeper:
         return self
 
     def __next__(self) -> tuple[ParameterSetEvent, ...]:
-        if self._iter_index < len(self):
+        if self._iter_index < self._num_points:
             return_val = self[self._iter_index]
             self._iter_index += 1
             return return_val
@@ -412,36 +506,38 @@ class _Measurements:
             )
         return experiments_internal
 
-    def _create_groups_from_grouped_parameters(
+    def _create_groups(
         self,
-        grouped_parameters: tuple[tuple[ParamMeasT, ...], ...],
+        group_specs: Sequence[tuple[tuple[ParameterBase, ...], tuple[ParamMeasT, ...]]],
         experiments: Experiment | Sequence[Experiment] | None,
         meas_names: str | Sequence[str],
     ) -> tuple[_SweepMeasGroup, ...]:
-        setpoints = self._sweeper.all_setpoint_params
+        experiments_internal = self._get_experiments(experiments, len(group_specs))
+        measurement_names = self._create_measurement_names(meas_names, len(group_specs))
 
         groups = []
-        m_group: Sequence[ParamMeasT]
-
-        experiments_internal = self._get_experiments(
-            experiments, len(grouped_parameters)
-        )
-        measurement_names = self._create_measurement_names(
-            meas_names, len(grouped_parameters)
-        )
-
-        for m_group, experiment, meas_name in zip(
-            grouped_parameters,
+        for (sp_group, m_group), experiment, meas_name in zip(
+            group_specs,
             experiments_internal,
             measurement_names,
         ):
             meas_ctx = self._create_measurement_ctx_manager(
-                experiment, meas_name, setpoints, tuple(m_group)
+                experiment, meas_name, sp_group, m_group
             )
-            s_m_group = _SweepMeasGroup(setpoints, tuple(m_group), meas_ctx)
+            s_m_group = _SweepMeasGroup(sp_group, m_group, meas_ctx)
             groups.append(s_m_group)
         return tuple(groups)
 
+    def _create_groups_from_grouped_parameters(
+        self,
+        grouped_parameters: tuple[tuple[ParamMeasT, ...], ...],
+        experiments: Experiment | Sequence[Experiment] | None,
+        meas_names: str | Sequence[str],
+    ) -> tuple[_SweepMeasGroup, ...]:
+        setpoints = self._sweeper.all_setpoint_params
+        group_specs = [(setpoints, tuple(m_group)) for m_group in grouped_parameters]
+        return self._create_groups(group_specs, experiments, meas_names)
+
     def _create_groups_from_dataset_dependencies(
         self,
         dataset_dependencies: dict[
@@ -453,9 +549,6 @@ class _Measurements:
     ) -> tuple[_SweepMeasGroup, ...]:
         potential_setpoint_groups = self._sweeper.sweep_groupes
 
-        experiments_internal = self._get_experiments(
-            experiments, len(dataset_dependencies)
-        )
         if meas_names == "":
             meas_names = tuple(dataset_dependencies.keys())
 
@@ -476,11 +569,8 @@ class _Measurements:
                     f"to any dataset in dataset_dependencies."
                 )
 
-        groups = []
-        for experiment, meas_name in zip(
-            experiments_internal,
-            measurement_names,
-        ):
+        group_specs = []
+        for meas_name in measurement_names:
             (sp_group, m_group) = dataset_dependencies[meas_name]
             if tuple(sp_group) not in potential_setpoint_groups:
                 raise ValueError(
@@ -493,12 +583,8 @@ class _Measurements:
                 f"creating context manager for setpoints"
                 f" {sp_group} and measurement parameters {m_group}"
             )
-            meas_ctx = self._create_measurement_ctx_manager(
-                experiment, meas_name, tuple(sp_group), tuple(m_group)
-            )
-            s_m_group = _SweepMeasGroup(tuple(sp_group), tuple(m_group), meas_ctx)
-            groups.append(s_m_group)
-        return tuple(groups)
+            group_specs.append((tuple(sp_group), tuple(m_group)))
+        return self._create_groups(group_specs, experiments, measurement_names)
 
     def _create_measurement_ctx_manager(
         self,
@@ -561,11 +647,18 @@ class _SweepMeasGroup:
             a for a in self.measure_parameters if isinstance(a, ParameterBase)
         )
         self._parameters = self.sweep_parameters + meas_parameters
+        # parameters are hashable by identity so membership tests in the
+        # measurement loop can be O(1) rather than scanning the tuple
+        self._parameter_set = frozenset(self._parameters)
 
     @property
     def parameters(self) -> tuple[ParameterBase, ...]:
         return self._parameters
 
+    @property
+    def parameter_set(self) -> frozenset[ParameterBase]:
+        return self._parameter_set
+
 
 @overload
 def dond(
@@ -679,7 +772,9 @@ def dond(
 
 
         write_period: The time after which the data is actually written to the
-            database.
+            database. Results are buffered in memory between writes, so for
+            fast scans a larger write period batches many points into each
+            database transaction and reduces the time spent on I/O.
         measurement_name: Name(s) of the measurement. This will be passed down to
             the dataset produced by the measurement. If not given, a default
             value of 'results' is used for the dataset. If more than one is
@@ -791,15 +886,53 @@ def dond(
                 for group in measurements.groups
             ]
             additional_setpoints_data = process_params_meas(additional_setpoints)
-            for set_events in tqdm(sweeper, disable=not show_progress):
-                LOG.debug("Processing set events: %s", set_events)
-                results: dict[ParameterBase, Any] = {}
+            # map each parameter to the indices of the groups it belongs to
+            # so results can be dispatched in a single pass per step instead
+            # of filtering the full result dict once per group
+            param_to_group_indices: dict[ParameterBase, tuple[int, ...]] = {}
+            for group_index, group in enumerate(measurements.groups):
+                for parameter in group.parameter_set:
+                    param_to_group_indices[parameter] = (
+                        *param_to_group_indices.get(parameter, ()),
+                        group_index,
+                    )
+            # reuse the same containers on every step rather than
+            # reallocating them per setpoint
+            results: dict[ParameterBase, Any] = {}
+            per_group_results: list[list[tuple[ParameterBase, Any]]] = [
+                [] for _ in measurements.groups
+            ]
+            # bind the per-step callables and loop invariants to locals once;
+            # attribute lookups and the callable() check are pure overhead
+            # when repeated for every setpoint
+            add_results_and_lists = tuple(
+                (datasaver.add_result, group_results)
+                for datasaver, group_results in zip(datasavers, per_group_results)
+            )
+            break_condition_fn = break_condition if callable(break_condition) else None
+            log_set_events = LOG.isEnabledFor(logging.DEBUG)
+            # tqdm does per-iteration bookkeeping even when disabled, so only
+            # wrap the sweeper when a progress bar was actually requested and
+            # throttle refreshes for long scans
+            set_events_iterator: Iterable[tuple[ParameterSetEvent, ...]] = sweeper
+            if show_progress:
+                set_events_iterator = tqdm(
+                    sweeper,
+                    miniters=max(1, len(sweeper) // 1000),
+                    mininterval=0.2,
+                )
+            for set_events in set_events_iterator:
+                if log_set_events:
+                    LOG.debug("Processing set events: %s", set_events)
+                results.clear()
                 for set_event in set_events:
                     if set_event.should_set:
                         set_event.parameter(set_event.new_value)
-                        for act in set_event.actions:
-                            act()
-                        time.sleep(set_event.delay)
+                        if set_event.actions:
+                            for act in set_event.actions:
+                                act()
+                        if set_event.delay:
+                            time.sleep(set_event.delay)
 
                     if set_event.get_after_set:
                         results[set_event.parameter] = set_event.parameter()
@@ -810,20 +943,20 @@ def dond(
                 for meas_param, value in meas_value_pair:
                     results[meas_param] = value
 
-                for datasaver, group in zip(datasavers, measurements.groups):
-                    filtered_results_list = [
-                        (param, value)
-                        for param, value in results.items()
-                        if param in group.parameters
-                    ]
-                    datasaver.add_result(
+                for group_results in per_group_results:
+                    group_results.clear()
+                for param, value in results.items():
+                    for group_index in param_to_group_indices.get(param, ()):
+                        per_group_results[group_index].append((param, value))
+
+                for add_result, filtered_results_list in add_results_and_lists:
+                    add_result(
                         *filtered_results_list,
                         *additional_setpoints_data,
                     )
 
-                if callable(break_condition):
-                    if break_condition():
-                        raise BreakConditionInterrupt("Break condition was met.")
+                if break_condition_fn is not None and break_condition_fn():
+                    raise BreakConditionInterrupt("Break condition was met.")
     finally:
         for datasaver in datasavers:
             ds, plot_axis, plot_color = _handle_plotting(
@@ -194,9 +194,11 @@ def dond_into(
             for set_event in set_events:
                 if set_event.should_set:
                     set_event.parameter(set_event.new_value)
-                    for act in set_event.actions:
-                        act()
-                    time.sleep(set_event.delay)
+                    if set_event.actions:
+                        for act in set_event.actions:
+                            act()
+                    if set_event.delay:
+                        time.sleep(set_event.delay)
 
                 if set_event.get_after_set:
                     results[set_event.parameter] = set_event.parameter()
@@ -1,437 +1,475 @@
+import logging
 import re
-from unittest.mock import call
+from contextlib import contextmanager
 
 import numpy as np
 import pytest
 
 from qcodes.instrument_drivers.Keysight.keysightb1500 import constants
-from qcodes.instrument_drivers.Keysight.keysightb1500.KeysightB1520A import (
-    KeysightB1520A,
-)
-
 
-@pytest.fixture(name="cmu")
+# resolve the enum members used throughout this file once instead of
+# walking the constants attribute chains in every test
+_OPEN = constants.CalibrationType.OPEN
+_SHORT = constants.CalibrationType.SHORT
+_LOAD = constants.CalibrationType.LOAD
+_ADJ_MANUAL = constants.ADJ.Mode.MANUAL
+_ADJ_USE_LAST = constants.ADJQuery.Mode.USE_LAST
+_ADJ_PASSED = constants.ADJQuery.Response.PASSED
+_CORR_SUCCESSFUL = constants.CORR.Response.SUCCESSFUL
+_CORRST_ON = constants.CORRST.Response.ON
+
+# instrument responses shared by the sweep tests, spelled out once so the
+# expected wire format is auditable at a glance
+_WDCV_LINEAR_RESPONSE = "WDCV3,1,-1.0,1.0,5"
+_WDCV_LINEAR_TWO_WAY_RESPONSE = "WDCV3,3,-1.0,1.0,5"
+_RUN_SWEEP_RESPONSE = (
+    "WMDCV2,2;WTDCV0.00,0.0000,0.2250,0.0000,0.0000;WDCV3,1,-1.0,1.0,5;ACT0,1"
+)
+_XE_RESPONSE = "NCC-1.45713E-06,NCV-3.05845E-03"
+
+
+def _all_parameters(instrument):
+    yield from instrument.parameters.values()
+    for submodule in instrument.submodules.values():
+        yield from _all_parameters(submodule)
+
+
+class _FakeTimeoutParameter:
+    @contextmanager
+    def set_to(self, value):
+        yield
+
+
+class _FakeMainframe:
+    """
+    Minimal stand-in for the B1500 mainframe used by the CMU driver.
+
+    ``MagicMock`` records every call through Python-level bookkeeping; for a
+    file that only exercises ``write(str)`` and ``ask(str) -> str`` a plain
+    recorder with two lists is much cheaper and lets tests assert on the
+    message lists directly.
+    """
+
+    def __init__(self):
+        self.writes: list[str] = []
+        self.asks: list[str] = []
+        #: response returned by :meth:`ask` when no side effect is set
+        self.ask_return = None
+        #: a list of responses consumed in order, or a callable of the message
+        self.ask_side_effect = None
+
+        self.name_parts = ["mainframe"]
+        self.short_name = "short_name"
+        self.full_name = "mainframe"
+        # group parameters route their I/O through ``root_instrument``, so
+        # point it back at the object that records the write/ask calls
+        self.root_instrument = self
+        self.parent = self
+        self.timeout = _FakeTimeoutParameter()
+        # manual parameters log their get/set on ``root_instrument.log``
+        self.log = logging.getLogger(__name__)
+
+    def write(self, cmd: str) -> None:
+        self.writes.append(cmd)
+
+    def ask(self, cmd: str) -> str:
+        self.asks.append(cmd)
+        if callable(self.ask_side_effect):
+            return self.ask_side_effect(cmd)
+        if self.ask_side_effect is not None:
+            return self.ask_side_effect.pop(0)
+        return self.ask_return
+
+    def reset(self) -> None:
+        self.writes.clear()
+        self.asks.clear()
+        self.ask_return = None
+        self.ask_side_effect = None
+
+
+def _assert_wrote_in_order(mainframe, expected):
+    # the equivalent of ``assert_has_calls``: the expected messages must
+    # appear in this order, with other writes allowed in between
+    written = iter(mainframe.writes)
+    for message in expected:
+        assert message in written, (
+            f"{message!r} not written (in order); writes were {mainframe.writes!r}"
+        )
+
+
+@pytest.fixture(name="mainframe", scope="module")
+def _make_mainframe():
+    # module-scoped override of the function-scoped conftest fixture so the
+    # driver below is only instantiated once for this file
+    yield _FakeMainframe()
+
+
+@pytest.fixture(name="cmu", scope="module")
 def _make_cmu(mainframe):
+    # import lazily so collecting this module does not pull in the full
+    # instrument hierarchy behind the driver
+    from qcodes.instrument_drivers.Keysight.keysightb1500.KeysightB1520A import (
+        KeysightB1520A,
+    )
+
     slot_nr = 3
     cmu = KeysightB1520A(parent=mainframe, name="B1520A", slot_nr=slot_nr)
     # GroupParameter with initial values write at the init so reset the mock
     # to not count those write
-    mainframe.reset_mock()
+    mainframe.reset()
 
     yield cmu
 
 
-def test_force_dc_voltage(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.voltage_dc(10)
-
-    mainframe.write.assert_called_once_with("DCV 3,10")
+@pytest.fixture(name="_initial_parameter_caches", scope="module")
+def _make_initial_parameter_caches(cmu):
+    return {
+        param: (
+            param.cache.valid,
+            param.cache.get(get_if_invalid=False),
+            param.cache.raw_value,
+            param.cache.timestamp,
+        )
+        for param in _all_parameters(cmu)
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cmu_state(cmu, mainframe, _initial_parameter_caches):
+    # the driver instance is reused for the whole module, so restore the
+    # state a freshly constructed driver would have before every test
+    mainframe.reset()
+    cmu.setup_fnc_already_run = False
+    for param, (
+        valid,
+        value,
+        raw_value,
+        timestamp,
+    ) in _initial_parameter_caches.items():
+        if valid:
+            param.cache._update_with(
+                value=value, raw_value=raw_value, timestamp=timestamp
+            )
+        else:
+            param.cache.invalidate()
+    yield
 
 
-def test_force_ac_voltage(cmu) -> None:
-    mainframe = cmu.parent
+class TestVoltage:
+    def test_force_dc_voltage(self, cmu, mainframe) -> None:
+        cmu.voltage_dc(10)
 
-    cmu.voltage_ac(0.1)
+        assert mainframe.writes == ["DCV 3,10"]
 
-    mainframe.write.assert_called_once_with("ACV 3,0.1")
+    def test_force_ac_voltage(self, cmu, mainframe) -> None:
+        cmu.voltage_ac(0.1)
 
+        assert mainframe.writes == ["ACV 3,0.1"]
 
-def test_set_ac_frequency(cmu) -> None:
-    mainframe = cmu.parent
+    def test_set_ac_frequency(self, cmu, mainframe) -> None:
+        cmu.frequency(100e3)
 
-    cmu.frequency(100e3)
+        assert mainframe.writes == ["FC 3,100000.0"]
 
-    mainframe.write.assert_called_once_with("FC 3,100000.0")
+    def test_get_dc_voltage(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "DCV3,0.000;ACV3,0.0;FC3,1000.000"
+        response = cmu.voltage_dc()
+        assert response == 0.0
 
+        mainframe.reset()
+        mainframe.ask_return = "DCV3,0.001;ACV3,0.0;FC3,1000.000"
+        response = cmu.voltage_dc()
+        assert response == 0.001
 
-def test_get_dc_voltage(cmu) -> None:
-    mainframe = cmu.parent
-    mainframe.ask.return_value = "DCV3,0.000;ACV3,0.0;FC3,1000.000"
-    response = cmu.voltage_dc()
-    assert response == 0.0
+        mainframe.reset()
+        mainframe.ask_return = "DCV3,13.051;ACV3,0.0;FC3,1000.000"
+        response = cmu.voltage_dc()
+        assert response == 13.051
 
-    mainframe.reset_mock()
-    mainframe.ask.return_value = "DCV3,0.001;ACV3,0.0;FC3,1000.000"
-    response = cmu.voltage_dc()
-    assert response == 0.001
+    def test_get_ac_voltage(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "DCV3,0.000;ACV3,0.000;FC3,1000.000"
+        response = cmu.voltage_ac()
+        assert response == 0.0
 
-    mainframe.reset_mock()
-    mainframe.ask.return_value = "DCV3,13.051;ACV3,0.0;FC3,1000.000"
-    response = cmu.voltage_dc()
-    assert response == 13.051
+        mainframe.reset()
+        mainframe.ask_return = "DCV3,0.001;ACV3,0.01;FC3,1000.000"
+        response = cmu.voltage_ac()
+        assert response == 0.01
 
+        mainframe.reset()
+        mainframe.ask_return = "DCV3,13.051;ACV3,3.045;FC3,1000.000"
+        response = cmu.voltage_ac()
+        assert response == 3.045
 
-def test_get_ac_voltage(cmu) -> None:
-    mainframe = cmu.parent
-    mainframe.ask.return_value = "DCV3,0.000;ACV3,0.000;FC3,1000.000"
-    response = cmu.voltage_ac()
-    assert response == 0.0
+    def test_get_frequency(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "DCV3,0.000;ACV3,0.000;FC3,100000.000"
+        response = cmu.frequency()
+        assert response == 100000.0
 
-    mainframe.reset_mock()
-    mainframe.ask.return_value = "DCV3,0.001;ACV3,0.01;FC3,1000.000"
-    response = cmu.voltage_ac()
-    assert response == 0.01
+        mainframe.reset()
+        mainframe.ask_return = "DCV3,0.001;ACV3,0.01;FC3,1000.033"
+        response = cmu.frequency()
+        assert response == 1000.033
 
-    mainframe.reset_mock()
-    mainframe.ask.return_value = "DCV3,13.051;ACV3,3.045;FC3,1000.000"
-    response = cmu.voltage_ac()
-    assert response == 3.045
+        mainframe.reset()
+        mainframe.ask_return = "DCV3,13.051;ACV3,3.045;FC3,1540.40"
+        response = cmu.frequency()
+        assert response == 1540.40
 
 
-def test_get_frequency(cmu) -> None:
-    mainframe = cmu.parent
-    mainframe.ask.return_value = "DCV3,0.000;ACV3,0.000;FC3,100000.000"
-    response = cmu.frequency()
-    assert response == 100000.0
+class TestMeasurement:
+    def test_get_capacitance(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "NCC-1.45713E-06,NCD-3.05845E-03"
 
-    mainframe.reset_mock()
-    mainframe.ask.return_value = "DCV3,0.001;ACV3,0.01;FC3,1000.033"
-    response = cmu.frequency()
-    assert response == 1000.033
-
-    mainframe.reset_mock()
-    mainframe.ask.return_value = "DCV3,13.051;ACV3,3.045;FC3,1540.40"
-    response = cmu.frequency()
-    assert response == 1540.40
-
-
-def test_get_capacitance(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = "NCC-1.45713E-06,NCD-3.05845E-03"
-
-    assert pytest.approx((-1.45713e-06, -3.05845e-03)) == cmu.capacitance()
-
-    mainframe.ask.return_value = (
-        "NCC-1.55713E-06,NCD-3.15845E-03,NCV-1.52342E-03,NCV+0.14235E-03"
-    )
+        assert cmu.capacitance() == (-1.45713e-06, -3.05845e-03)
 
-    assert pytest.approx((-1.55713e-06, -3.15845e-03)) == cmu.capacitance()
+        mainframe.ask_return = (
+            "NCC-1.55713E-06,NCD-3.15845E-03,NCV-1.52342E-03,NCV+0.14235E-03"
+        )
 
+        assert cmu.capacitance() == (-1.55713e-06, -3.15845e-03)
 
-def test_raise_error_on_unsupported_result_format(cmu) -> None:
-    mainframe = cmu.parent
+    def test_raise_error_on_unsupported_result_format(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "NCR-1.1234E-03,NCX-4.5677E-03,NCV+0.14235E-03"
 
-    mainframe.ask.return_value = "NCR-1.1234E-03,NCX-4.5677E-03,NCV+0.14235E-03"
+        with pytest.raises(ValueError):
+            cmu.capacitance()
 
-    with pytest.raises(ValueError):
-        cmu.capacitance()
+    def test_ranging_mode(self, cmu, mainframe) -> None:
+        cmu.ranging_mode(constants.RangingMode.AUTO)
 
+        assert mainframe.writes == ["RC 3,0"]
 
-def test_ranging_mode(cmu) -> None:
-    mainframe = cmu.parent
+    def test_abort(self, cmu, mainframe) -> None:
+        cmu.abort()
 
-    cmu.ranging_mode(constants.RangingMode.AUTO)
+        assert mainframe.writes == ["AB"]
 
-    mainframe.write.assert_called_once_with("RC 3,0")
 
+class TestSweep:
+    def test_set_sweep_auto_abort(self, cmu, mainframe) -> None:
+        cmu.cv_sweep.sweep_auto_abort(constants.Abort.ENABLED)
 
-def test_set_sweep_auto_abort(cmu) -> None:
-    mainframe = cmu.parent
+        assert mainframe.writes == ["WMDCV 2"]
 
-    cmu.cv_sweep.sweep_auto_abort(constants.Abort.ENABLED)
+    def test_get_sweep_auto_abort(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "WMDCV2,2;WTDCV1.0,0.0,0.0,0.0,0.0"
+        condition = cmu.cv_sweep.sweep_auto_abort()
+        assert condition == constants.Abort.ENABLED
 
-    mainframe.write.assert_called_once_with("WMDCV 2")
+    def test_set_post_sweep_voltage_cond(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "WMDCV2,2;WTDCV1.0,0.0,0.0,0.0,0.0"
+        cmu.cv_sweep.post_sweep_voltage_condition.set(constants.WMDCV.Post.STOP)
 
+        assert mainframe.writes == ["WMDCV 2,2"]
 
-def test_get_sweep_auto_abort(cmu) -> None:
-    mainframe = cmu.parent
+    def test_get_post_sweep_voltage_cond(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "WMDCV2,2;WTDCV1.0,0.0,0.0,0.0,0.0"
+        condition = cmu.cv_sweep.post_sweep_voltage_condition()
+        assert condition == constants.WMDCV.Post.STOP
 
-    mainframe.ask.return_value = "WMDCV2,2;WTDCV1.0,0.0,0.0,0.0,0.0"
-    condition = cmu.cv_sweep.sweep_auto_abort()
-    assert condition == constants.Abort.ENABLED
+        mainframe.reset()
 
+        mainframe.ask_return = "WMDCV2;WTDCV1.0,0.0,0.0,0.0,0.0"
+        msg = re.escape(
+            "Received None. Set the parameter``post_sweep_voltage_condition`` first."
+        )
+        with pytest.raises(ValueError, match=msg):
+            cmu.cv_sweep.post_sweep_voltage_condition()
 
-def test_set_post_sweep_voltage_cond(cmu) -> None:
-    mainframe = cmu.parent
-    mainframe.ask.return_value = "WMDCV2,2;WTDCV1.0,0.0,0.0,0.0,0.0"
-    cmu.cv_sweep.post_sweep_voltage_condition.set(constants.WMDCV.Post.STOP)
-
-    mainframe.write.assert_called_once_with("WMDCV 2,2")
-
-
-def test_get_post_sweep_voltage_cond(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = "WMDCV2,2;WTDCV1.0,0.0,0.0,0.0,0.0"
-    condition = cmu.cv_sweep.post_sweep_voltage_condition()
-    assert condition == constants.WMDCV.Post.STOP
-
-    mainframe.reset_mock()
-
-    mainframe.ask.return_value = "WMDCV2;WTDCV1.0,0.0,0.0,0.0,0.0"
-    msg = re.escape(
-        "Received None. Set the parameter``post_sweep_voltage_condition`` first."
-    )
-    with pytest.raises(ValueError, match=msg):
-        cmu.cv_sweep.post_sweep_voltage_condition()
-
-
-def test_cv_sweep_delay(cmu) -> None:
-    mainframe = cmu.root_instrument
-
-    mainframe.ask.return_value = "WTDCV0.0,0.0,0.0,0.0,0.0"
-
-    cmu.cv_sweep.hold_time(1.0)
-    cmu.cv_sweep.delay(1.0)
-
-    mainframe.write.assert_has_calls(
-        [call("WTDCV 1.0,0.0,0.0,0.0,0.0"), call("WTDCV 1.0,1.0,0.0,0.0,0.0")]
-    )
+    def test_cv_sweep_delay(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "WTDCV0.0,0.0,0.0,0.0,0.0"
 
+        cmu.cv_sweep.hold_time(1.0)
+        cmu.cv_sweep.delay(1.0)
 
-def test_cmu_sweep_steps(cmu) -> None:
-    mainframe = cmu.root_instrument
-    mainframe.ask.return_value = "WDCV3,1,0.0,0.0,1"
-    cmu.cv_sweep.sweep_start(2.0)
-    cmu.cv_sweep.sweep_end(4.0)
-
-    mainframe.write.assert_has_calls(
-        [call("WDCV 3,1,2.0,0.0,1"), call("WDCV 3,1,2.0,4.0,1")]
-    )
-
-
-def test_cv_sweep_voltages(cmu) -> None:
-    mainframe = cmu.root_instrument
-
-    start = -1.0
-    end = 1.0
-    steps = 5
-    return_string = f"WDCV3,1,{start},{end},{steps}"
-    mainframe.ask.return_value = return_string
-
-    cmu.cv_sweep.sweep_start(start)
-    cmu.cv_sweep.sweep_end(end)
-    cmu.cv_sweep.sweep_steps(steps)
-    voltages = cmu.cv_sweep_voltages()
-
-    assert all([a == b for a, b in zip(np.linspace(start, end, steps), voltages)])
-
-
-def test_sweep_modes(cmu) -> None:
-    mainframe = cmu.root_instrument
-
-    start = -1.0
-    end = 1.0
-    steps = 5
-    mode = constants.SweepMode.LINEAR_TWO_WAY
-    return_string = f"WDCV3,{mode},{start},{end},{steps}"
-    mainframe.ask.return_value = return_string
-
-    cmu.cv_sweep.sweep_start(start)
-    cmu.cv_sweep.sweep_end(end)
-    cmu.cv_sweep.sweep_steps(steps)
-    cmu.cv_sweep.sweep_mode(mode)
-    voltages = cmu.cv_sweep_voltages()
-
-    assert all([a == b for a, b in zip((-1.0, 0.0, 1.0, 0.0, -1.0), voltages)])
-
+        assert mainframe.writes == [
+            "WTDCV 1.0,0.0,0.0,0.0,0.0",
+            "WTDCV 1.0,1.0,0.0,0.0,0.0",
+        ]
 
-def test_run_sweep(cmu) -> None:
-    mainframe = cmu.root_instrument
+    def test_cmu_sweep_steps(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "WDCV3,1,0.0,0.0,1"
+        cmu.cv_sweep.sweep_start(2.0)
+        cmu.cv_sweep.sweep_end(4.0)
 
-    start = -1.0
-    end = 1.0
-    steps = 5
+        assert mainframe.writes == [
+            "WDCV 3,1,2.0,0.0,1",
+            "WDCV 3,1,2.0,4.0,1",
+        ]
 
-    return_string = (
-        f"WMDCV2,2;WTDCV0.00,0.0000,0.2250,0.0000,"
-        f"0.0000;WDCV3,"
-        f"1,{start},{end},{steps};ACT0,1"
-    )
-    mainframe.ask.return_value = return_string
-    cmu.setup_fnc_already_run = True
-    cmu.impedance_model(constants.IMP.MeasurementMode.G_X)
-    cmu.cv_sweep.sweep_start(start)
-    cmu.cv_sweep.sweep_end(end)
-    cmu.cv_sweep.sweep_steps(steps)
-    cmu.adc_mode(constants.ACT.Mode.PLC)
-    cmu.adc_coef(5)
-    cmu.run_sweep()
-    mainframe.write.assert_has_calls(
+    def test_cv_sweep_voltages(self, cmu, mainframe) -> None:
+        start = -1.0
+        end = 1.0
+        steps = 5
+        mainframe.ask_return = _WDCV_LINEAR_RESPONSE
+
+        cmu.cv_sweep.sweep_start(start)
+        cmu.cv_sweep.sweep_end(end)
+        cmu.cv_sweep.sweep_steps(steps)
+        voltages = cmu.cv_sweep_voltages()
+
+        np.testing.assert_array_equal(
+            np.asarray(voltages), np.array([-1.0, -0.5, 0.0, 0.5, 1.0])
+        )
+
+    def test_sweep_modes(self, cmu, mainframe) -> None:
+        start = -1.0
+        end = 1.0
+        steps = 5
+        mode = constants.SweepMode.LINEAR_TWO_WAY
+        mainframe.ask_return = _WDCV_LINEAR_TWO_WAY_RESPONSE
+
+        cmu.cv_sweep.sweep_start(start)
+        cmu.cv_sweep.sweep_end(end)
+        cmu.cv_sweep.sweep_steps(steps)
+        cmu.cv_sweep.sweep_mode(mode)
+        voltages = cmu.cv_sweep_voltages()
+
+        np.testing.assert_array_equal(
+            np.asarray(voltages), np.array([-1.0, 0.0, 1.0, 0.0, -1.0])
+        )
+
+    def test_run_sweep(self, cmu, mainframe) -> None:
+        start = -1.0
+        end = 1.0
+        steps = 5
+
+        def fake_ask(cmd: str) -> str:
+            # the sweep parameter issues an ``XE`` measurement query; everything
+            # else in this test reads back group parameters via ``*LRN?``
+            if cmd == "XE":
+                return _XE_RESPONSE
+            return _RUN_SWEEP_RESPONSE
+
+        mainframe.ask_side_effect = fake_ask
+        cmu.setup_fnc_already_run = True
+        cmu.impedance_model(constants.IMP.MeasurementMode.G_X)
+        cmu.cv_sweep.sweep_start(start)
+        cmu.cv_sweep.sweep_end(end)
+        cmu.cv_sweep.sweep_steps(steps)
+        cmu.adc_mode(constants.ACT.Mode.PLC)
+        cmu.adc_coef(5)
+        cmu.run_sweep()
+        _assert_wrote_in_order(
+            mainframe,
+            [
+                "WDCV 3,1,-1.0,0.0,1",
+                "WDCV 3,1,-1.0,1.0,1",
+                "WDCV 3,1,-1.0,1.0,5",
+                "ACT 2,1",
+                "ACT 2,5",
+            ],
+        )
+        assert cmu.run_sweep.names == ("conductance", "reactance")
+        assert cmu.run_sweep.labels == ("Conductance", "Reactance")
+        assert cmu.run_sweep.units == ("S", "ohms")
+
+
+class TestPhaseCompensation:
+    def test_phase_compensation_mode(self, cmu, mainframe) -> None:
+        cmu.phase_compensation_mode(_ADJ_MANUAL)
+
+        assert mainframe.writes == ["ADJ 3,1"]
+
+        assert _ADJ_MANUAL == cmu.phase_compensation_mode()
+
+    def test_phase_compensation(self, cmu, mainframe) -> None:
+        mainframe.ask_return = 0
+
+        response = cmu.phase_compensation()
+
+        assert mainframe.asks == ["ADJ? 3"]
+        assert isinstance(response, constants.ADJQuery.Response)
+        assert response == _ADJ_PASSED
+
+    def test_phase_compensation_with_mode(self, cmu, mainframe) -> None:
+        mainframe.ask_return = 0
+
+        response = cmu.phase_compensation(_ADJ_USE_LAST)
+
+        assert mainframe.asks == ["ADJ? 3,0"]
+        assert isinstance(response, constants.ADJQuery.Response)
+        assert response == _ADJ_PASSED
+
+
+class TestCorrection:
+    @pytest.mark.parametrize("action,flag", [("enable", 1), ("disable", 0)])
+    @pytest.mark.parametrize(
+        "cal_type,code",
         [
-            call("WDCV 3,1,-1.0,0.0,1"),
-            call("WDCV 3,1,-1.0,1.0,1"),
-            call("WDCV 3,1,-1.0,1.0,5"),
-            call("ACT 2,1"),
-            call("ACT 2,5"),
-        ]
+            (_OPEN, 1),
+            (_SHORT, 2),
+            (_LOAD, 3),
+        ],
     )
-    assert cmu.run_sweep.names == ("conductance", "reactance")
-    assert cmu.run_sweep.labels == ("Conductance", "Reactance")
-    assert cmu.run_sweep.units == ("S", "ohms")
-
-
-def test_phase_compensation_mode(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.phase_compensation_mode(constants.ADJ.Mode.MANUAL)
-
-    mainframe.write.assert_called_once_with("ADJ 3,1")
-
-    assert constants.ADJ.Mode.MANUAL == cmu.phase_compensation_mode()
-
-
-def test_phase_compensation(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = 0
-
-    response = cmu.phase_compensation()
+    def test_correction_enable_disable(
+        self, cmu, mainframe, action, flag, cal_type, code
+    ) -> None:
+        getattr(cmu.correction, action)(cal_type)
 
-    mainframe.ask.assert_called_once_with("ADJ? 3")
-    assert isinstance(response, constants.ADJQuery.Response)
-    assert response == constants.ADJQuery.Response.PASSED
+        assert mainframe.writes == [f"CORRST 3,{code},{flag}"]
 
+    def test_correction_is_enabled(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "1"
 
-def test_phase_compensation_with_mode(cmu) -> None:
-    mainframe = cmu.parent
+        response = cmu.correction.is_enabled(_SHORT)
+        assert response == _CORRST_ON
 
-    mainframe.ask.return_value = 0
+    def test_correction_set_reference_values(self, cmu, mainframe) -> None:
+        cmu.correction.set_reference_values(_OPEN, constants.DCORR.Mode.Cp_G, 1, 2)
+        assert mainframe.writes == ["DCORR 3,1,100,1,2"]
 
-    response = cmu.phase_compensation(constants.ADJQuery.Mode.USE_LAST)
+    def test_correction_get_reference_values(self, cmu, mainframe) -> None:
+        mainframe.ask_return = "100,0.001,2"
+        response = "Mode: Cp_G, Primary Cp: 0.001 F, Secondary G: 2.0 S"
+        assert response == cmu.correction.get_reference_values(_OPEN)
 
-    mainframe.ask.assert_called_once_with("ADJ? 3,0")
-    assert isinstance(response, constants.ADJQuery.Response)
-    assert response == constants.ADJQuery.Response.PASSED
-
-
-def test_enable_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.correction.enable(constants.CalibrationType.OPEN)
-    mainframe.write.assert_called_once_with("CORRST 3,1,1")
-
-    mainframe.reset_mock()
-
-    cmu.correction.enable(constants.CalibrationType.SHORT)
-    mainframe.write.assert_called_once_with("CORRST 3,2,1")
-
-    mainframe.reset_mock()
-
-    cmu.correction.enable(constants.CalibrationType.LOAD)
-    mainframe.write.assert_called_once_with("CORRST 3,3,1")
-
-
-def test_disable_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.correction.disable(constants.CalibrationType.OPEN)
-    mainframe.write.assert_called_once_with("CORRST 3,1,0")
-
-    mainframe.reset_mock()
-
-    cmu.correction.disable(constants.CalibrationType.SHORT)
-    mainframe.write.assert_called_once_with("CORRST 3,2,0")
-
-    mainframe.reset_mock()
-
-    cmu.correction.disable(constants.CalibrationType.LOAD)
-    mainframe.write.assert_called_once_with("CORRST 3,3,0")
-
-
-def test_correction_is_enabled(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = "1"
-
-    response = cmu.correction.is_enabled(constants.CalibrationType.SHORT)
-    assert response == constants.CORRST.Response.ON
-
-
-def test_correction_set_reference_values(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.correction.set_reference_values(
-        constants.CalibrationType.OPEN, constants.DCORR.Mode.Cp_G, 1, 2
+    @pytest.mark.parametrize(
+        "method,args,expected",
+        [
+            ("clear_and_set_default", (), "CLCORR 3,2"),
+            ("clear", (), "CLCORR 3,1"),
+            ("add", (1000,), "CORRL 3,1000"),
+        ],
     )
-    mainframe.write.assert_called_once_with("DCORR 3,1,100,1,2")
-
+    def test_frequency_list_for_correction_writes(
+        self, cmu, mainframe, method, args, expected
+    ) -> None:
+        getattr(cmu.correction.frequency_list, method)(*args)
 
-def test_correction_get_reference_values(cmu) -> None:
-    mainframe = cmu.parent
+        assert mainframe.writes == [expected]
 
-    mainframe.ask.return_value = "100,0.001,2"
-    response = "Mode: Cp_G, Primary Cp: 0.001 F, Secondary G: 2.0 S"
-    assert response == cmu.correction.get_reference_values(
-        constants.CalibrationType.OPEN
+    @pytest.mark.parametrize(
+        "kwargs,response,expected_query,expected_value",
+        [
+            ({}, "25", "CORRL? 3", 25),
+            ({"index": 0}, "1234.567", "CORRL? 3,0", 1234.567),
+        ],
     )
+    def test_query_from_frequency_list_for_correction(
+        self, cmu, mainframe, kwargs, response, expected_query, expected_value
+    ) -> None:
+        mainframe.ask_return = response
 
+        assert cmu.correction.frequency_list.query(**kwargs) == expected_value
+        assert mainframe.asks == [expected_query]
 
-def test_clear_and_set_default_frequency_list_for_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.correction.frequency_list.clear_and_set_default()
-
-    mainframe.write.assert_called_once_with("CLCORR 3,2")
-
+    def test_perform_correction(self, cmu, mainframe) -> None:
+        mainframe.ask_return = 0
 
-def test_clear_frequency_list_for_correction(cmu) -> None:
-    mainframe = cmu.parent
+        response = cmu.correction.perform(_OPEN)
+        assert _CORR_SUCCESSFUL == response
 
-    cmu.correction.frequency_list.clear()
-
-    mainframe.write.assert_called_once_with("CLCORR 3,1")
-
-
-def test_add_frequency_for_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    cmu.correction.frequency_list.add(1000)
-
-    mainframe.write.assert_called_once_with("CORRL 3,1000")
-
-
-def test_query_from_frequency_list_for_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = "25"
-
-    assert pytest.approx(25) == cmu.correction.frequency_list.query()
-    mainframe.ask.assert_called_once_with("CORRL? 3")
-
-
-def test_query_at_index_from_frequency_list_for_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = "1234.567"
-
-    assert pytest.approx(1234.567) == cmu.correction.frequency_list.query(index=0)
-    mainframe.ask.assert_called_once_with("CORRL? 3,0")
-
-
-def test_perform_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.return_value = 0
-
-    response = cmu.correction.perform(constants.CalibrationType.OPEN)
-    assert constants.CORR.Response.SUCCESSFUL == response
-
-
-def test_perform_and_enable_correction(cmu) -> None:
-    mainframe = cmu.parent
-
-    mainframe.ask.side_effect = [
-        "0",  # for correction status
-        "1",  # for correction state (enabled/disabled)
-    ]
-
-    response = cmu.correction.perform_and_enable(constants.CalibrationType.OPEN)
-
-    expected_response = (
-        f"Correction status "
-        f"{constants.CORR.Response.SUCCESSFUL.name} and "
-        f"Enable "
-        f"{constants.CORRST.Response.ON.name}"
-    )
-    assert response == expected_response
-
-
-def test_abort(cmu) -> None:
-    mainframe = cmu.parent
+    def test_perform_and_enable_correction(self, cmu, mainframe) -> None:
+        mainframe.ask_side_effect = [
+            "0",  # for correction status
+            "1",  # for correction state (enabled/disabled)
+        ]
 
-    cmu.abort()
+        response = cmu.correction.perform_and_enable(_OPEN)
 
-    mainframe.write.assert_called_once_with("AB")
+        expected_response = (
+            f"Correction status {_CORR_SUCCESSFUL.name} and Enable {_CORRST_ON.name}"
+        )
+        assert response == expected_response